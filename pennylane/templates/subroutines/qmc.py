@@ -147,12 +147,24 @@ def _make_V(dim):
     Returns:
         array: the :math:`\mathcal{V}` unitary
     """
-    assert dim % 2 == 0, "dimension for _make_V() must be even"
+    return np.diag(_make_V_diag(dim))
+
+
+def _make_V_diag(dim):
+    r"""Calculates the diagonal of the :math:`\mathcal{V}` unitary, which is :math:`+1` when the
+    end ancilla qubit is in the :math:`|1\rangle` state and :math:`-1` otherwise.
 
-    one = np.array([[0, 0], [0, 1]])
-    dim_without_qubit = int(dim / 2)
+    Args:
+        dim (int): dimension of :math:`\mathcal{V}`
+
+    Returns:
+        array: the diagonal of the :math:`\mathcal{V}` unitary
+    """
+    assert dim % 2 == 0, "dimension for _make_V() must be even"
 
-    return 2 * np.kron(np.eye(dim_without_qubit), one) - np.eye(dim)
+    V_diag = -np.ones(dim)
+    V_diag[1::2] = 1
+    return V_diag
 
 
 def _make_Z(dim):
@@ -165,9 +177,22 @@ def _make_Z(dim):
     Returns:
         array: the :math:`\mathcal{Z}` unitary
     """
-    Z = -np.eye(dim)
-    Z[0, 0] = 1
-    return Z
+    return np.diag(_make_Z_diag(dim))
+
+
+def _make_Z_diag(dim):
+    r"""Calculates the diagonal of the :math:`\mathcal{Z}` unitary, which is :math:`+1` for the
+    all :math:`|0\rangle` state and :math:`-1` otherwise.
+
+    Args:
+        dim (int): dimension of :math:`\mathcal{Z}`
+
+    Returns:
+        array: the diagonal of the :math:`\mathcal{Z}` unitary
+    """
+    Z_diag = -np.ones(dim)
+    Z_diag[0] = 1
+    return Z_diag
 
 
 def make_Q(A, R):
@@ -193,10 +218,11 @@ def make_Q(A, R):
     F = R @ A_big
     F_dagger = F.conj().T
 
+    # Z and V are diagonal, so right-multiplying by them only rescales columns
     dim = len(R)
-    V = _make_V(dim)
-    Z = _make_Z(dim)
-    UV = F @ Z @ F_dagger @ V
+    V_diag = _make_V_diag(dim)
+    Z_diag = _make_Z_diag(dim)
+    UV = ((F * Z_diag) @ F_dagger) * V_diag
 
     return UV @ UV
 
@@ -19,7 +19,9 @@ import pennylane as qml
 from pennylane.templates.subroutines.qmc import (
     QuantumMonteCarlo,
     _make_V,
+    _make_V_diag,
     _make_Z,
+    _make_Z_diag,
     func_to_unitary,
     make_Q,
     probs_to_unitary,
@@ -136,6 +138,14 @@ def test_Z():
     assert np.allclose(Z, Z_expected)
 
 
+@pytest.mark.parametrize("dim", [2, 4, 8])
+def test_V_Z_diag(dim):
+    """Test that the _make_V_diag and _make_Z_diag functions return the diagonals of the
+    _make_V and _make_Z unitaries"""
+    assert np.allclose(np.diag(_make_V_diag(dim)), _make_V(dim))
+    assert np.allclose(np.diag(_make_Z_diag(dim)), _make_Z(dim))
+
+
 def test_Q():
     """Test for the make_Q function using a fixed example"""
 